@@ -1,30 +1,50 @@
 from selenium import webdriver
 from selenium.common.exceptions import (
-    NoSuchElementException,
     StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
 )
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+try:
+    from selenium.webdriver.remote.client_config import ClientConfig
+except ImportError:  # Selenium < 4.23 has no ClientConfig
+    ClientConfig = None
 from configparser import SectionProxy
-from typing import Dict, Union
+from contextlib import contextmanager
+from typing import Dict, List, Union
 from abc import ABC, abstractmethod
 
+from lxml import etree
+from lxml import html as lxml_html
+
+import asyncio
+import atexit
+import functools
 import logging
 import os
 import configparser
+import pickle
+import queue
 import re
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import time
 import signal
+import sqlite3
 import sys
+import time
 
 
 def setup_logging():
-    log_level = os.getenv("LOG_LEVEL", "DEBUG").upper()
+    # INFO by default; set LOG_LEVEL=DEBUG to get the per-listing dumps
+    # and page snapshots back when diagnosing scraper issues.
+    log_level = os.getenv("LOG_LEVEL", "INFO").upper()
     numeric_level = getattr(logging, log_level, None)
     if not isinstance(numeric_level, int):
         raise ValueError(f"Invalid log level: {log_level}")
@@ -35,30 +55,133 @@ def setup_logging():
 
 # This is just to clear out irrelevant logs from thewebsites themselves
 class IgnoreBrowserLogsFilter(logging.Filter):
+    # One alternation scanned in a single pass, instead of five substring
+    # searches per log record.
+    _UNWANTED = re.compile(
+        "|".join(
+            re.escape(phrase)
+            for phrase in (
+                "Third-party cookie will be blocked",
+                "Google Maps JavaScript API has been loaded",
+                "google.maps.event.addDomListener() is deprecated",
+                "An iframe which has both allow-scripts and allow-same-origin",
+                "A parser-blocking, cross site",
+            )
+        )
+    )
+
     def filter(self, record):
-        unwanted_phrases = [
-            "Third-party cookie will be blocked",
-            "Google Maps JavaScript API has been loaded",
-            "google.maps.event.addDomListener() is deprecated",
-            "An iframe which has both allow-scripts and allow-same-origin",
-            "A parser-blocking, cross site",
-        ]
-        return not any(phrase in record.getMessage() for phrase in unwanted_phrases)
+        return self._UNWANTED.search(record.getMessage()) is None
 
 
 logger = setup_logging()
 logger.addFilter(IgnoreBrowserLogsFilter())  # Add the filter
 
 
+@functools.lru_cache(maxsize=4)
 def load_config(config_path: str = "websites.ini") -> configparser.ConfigParser:
+    """
+    Load the site configuration, using a pickle sidecar keyed on the ini
+    file's (mtime, size) to skip re-tokenizing an unchanged file. Repeat
+    calls within a process are memoized; the sidecar only matters across
+    restarts.
+    """
+    try:
+        stat = os.stat(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Failed to load configuration from {config_path}. Please check the file path and try again."
+        )
+    cache_key = (stat.st_mtime, stat.st_size)
+    cache_path = f"{config_path}.cache.pkl"
+
+    try:
+        with open(cache_path, "rb") as file:
+            cached_key, sections = pickle.load(file)
+        if cached_key == cache_key:
+            config = configparser.ConfigParser(interpolation=None)
+            config.read_dict(sections)
+            logger.debug(f"Loaded cached configuration from {cache_path}")
+            return config
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass  # Stale or unreadable cache; fall through to a full parse.
+
     config = configparser.ConfigParser(interpolation=None)
     if not config.read(config_path):
         raise FileNotFoundError(
             f"Failed to load configuration from {config_path}. Please check the file path and try again."
         )
+
+    sections = {section: dict(config.items(section)) for section in config.sections()}
+    try:
+        with open(cache_path, "wb") as file:
+            pickle.dump((cache_key, sections), file)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+
     return config
 
 
+# Webhook delivery happens on a single daemon thread so a slow Discord
+# round-trip never stalls a scrape; the shared session keeps the TLS
+# connection warm between messages.
+_notify_queue = queue.Queue()
+_notify_session = requests.Session()
+# Pooled keep-alive connections plus automatic backoff on Discord rate
+# limits and transient 5xx responses.
+_notify_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+        ),
+    ),
+)
+_notify_worker_started = threading.Lock()
+_notify_worker_thread = None
+
+
+def _notify_worker():
+    while True:
+        url, payload = _notify_queue.get()
+        try:
+            response = _notify_session.post(
+                url,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=10,
+            )
+            response.raise_for_status()
+            logger.info("Notification sent successfully.")
+        except requests.exceptions.RequestException as e:
+            logger.error("Failed to send notification: %s", e)
+        finally:
+            _notify_queue.task_done()
+
+
+def enqueue_notification(url, payload):
+    """Queue a webhook payload for asynchronous delivery."""
+    global _notify_worker_thread
+    with _notify_worker_started:
+        if _notify_worker_thread is None:
+            _notify_worker_thread = threading.Thread(
+                target=_notify_worker, daemon=True, name="notify-worker"
+            )
+            _notify_worker_thread.start()
+    _notify_queue.put((url, payload))
+
+
+def wait_for_pending_notifications():
+    """Block until every queued notification has been attempted."""
+    if _notify_worker_thread is not None:
+        _notify_queue.join()
+
+
 class AppConfig:
     def __init__(self):
         self.enable_notifications = os.getenv(
@@ -70,27 +193,235 @@ class AppConfig:
         self.config = load_config()
 
 
-class WebDriverBase:
-    def __init__(self, app_config: AppConfig):
-        self.app_config = app_config
-        self.driver_path = app_config.webdriver_path
-        self.driver = self._init_driver()
+class DriverPool:
+    """
+    Fixed-size pool of headless Chrome drivers shared by every hunter.
+    Caps memory at MAX_CONCURRENT_DRIVERS Chrome processes while still
+    letting any number of hunters scrape concurrently.
+    """
 
-    def _init_driver(self):
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, app_config: AppConfig, size: int = None):
+        self.driver_path = app_config.webdriver_path
+        self.size = size or int(os.getenv("MAX_CONCURRENT_DRIVERS", "2"))
+        # Even a healthy Chrome accumulates renderer cruft over hundreds of
+        # navigations; retire it after this many scrapes or this much wall
+        # time, whichever comes first, and start fresh.
+        self.max_uses = int(os.getenv("DRIVER_MAX_USES", "200"))
+        self.max_age_seconds = int(os.getenv("DRIVER_MAX_AGE_SECONDS", "1800"))
+        self._idle = queue.Queue()
+        # Counts free capacity: every borrowed driver holds one permit,
+        # released on clean return and on discard alike, so a hunter blocked
+        # at capacity is woken whether the driver survived or not.
+        self._slots = threading.Semaphore(self.size)
+        self._uses = {}
+        self._birth = {}
+        self._lock = threading.Lock()
+        self._service = None
+
+    @classmethod
+    def shared(cls, app_config: AppConfig):
+        """Return the process-wide pool, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls(app_config)
+                atexit.register(cls.close_shared)
+        return cls._shared_instance
+
+    @classmethod
+    def close_shared(cls):
+        with cls._shared_lock:
+            pool, cls._shared_instance = cls._shared_instance, None
+        if pool is not None:
+            pool.close_all()
+
+    def _ensure_service(self):
+        """
+        Start the chromedriver server once; every pooled session attaches to
+        it remotely, so adding a browser doesn't pay the binary's startup.
+        """
+        with self._lock:
+            if self._service is None:
+                service = ChromeService(executable_path=self.driver_path)
+                service.start()
+                self._service = service
+            return self._service
+
+    def _create_driver(self):
         chrome_options = Options()
-        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--headless=new")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920x1080")
         chrome_options.add_argument("--log-level=off")
-        service = ChromeService(executable_path=self.driver_path)
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Skip browser subsystems a single-page scraper never touches;
+        # each one is startup work and resident memory for nothing.
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-breakpad")
+        chrome_options.add_argument("--mute-audio")
+        chrome_options.add_argument("--no-first-run")
+        chrome_options.add_argument("--no-default-browser-check")
+        # The listing data is a tiny fraction of the page weight; skip the
+        # map tiles, photos, fonts and styling we never look at.
+        chrome_options.add_experimental_option(
+            "prefs",
+            {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            },
+        )
+        # Belt and braces with the prefs above: Blink skips image fetches
+        # entirely, while img[src] attributes (all we read) stay intact.
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        # One renderer process instead of one per embedded origin; we only
+        # scrape a single public page, so site isolation buys us nothing.
+        chrome_options.add_argument("--disable-features=IsolateOrigins,site-per-process")
+        # Return from driver.get() once the DOM is interactive rather than
+        # waiting for network idle; the explicit wait covers the rest.
+        chrome_options.page_load_strategy = "eager"
+        service = self._ensure_service()
+        if ClientConfig is not None:
+            try:
+                # Selenium's RemoteConnection defaults to a urllib3 pool of
+                # one; a wider pool keeps the local chromedriver socket warm
+                # through bursts of commands instead of reopening it.
+                return webdriver.Remote(
+                    command_executor=service.service_url,
+                    options=chrome_options,
+                    client_config=ClientConfig(
+                        remote_server_addr=service.service_url,
+                        init_args_for_pool_manager={"maxsize": 10},
+                    ),
+                )
+            except TypeError:
+                # Older 4.x without init_args_for_pool_manager / client_config.
+                pass
+        return webdriver.Remote(
+            command_executor=service.service_url, options=chrome_options
+        )
 
+    def _checkout(self):
+        # Blocks while all `size` drivers are borrowed; prefer a recycled
+        # idle driver once a permit is held, otherwise spin up a fresh one.
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        # Creation runs outside self._lock so a multi-second Chrome spawn
+        # never blocks drivers being returned; on failure the permit goes
+        # back, keeping a transient spawn error retryable next cycle
+        # instead of leaking a capacity slot.
+        try:
+            driver = self._create_driver()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._birth[driver] = time.monotonic()
         return driver
 
-    def close_driver(self):
-        self.driver.quit()
+    def _discard(self, driver, release_slot=True):
+        # release_slot is False only for idle drivers (close_all), which
+        # hold no capacity permit.
+        with self._lock:
+            self._uses.pop(driver, None)
+            self._birth.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        if release_slot:
+            self._slots.release()
+
+    @contextmanager
+    def acquire(self):
+        """
+        Borrow a driver. A clean return recycles it (cookies cleared, blank
+        page); an exception discards it so a broken browser never circulates.
+        """
+        driver = self._checkout()
+        try:
+            yield driver
+        except Exception:
+            self._discard(driver)
+            raise
+        else:
+            with self._lock:
+                self._uses[driver] = self._uses.get(driver, 0) + 1
+                age = time.monotonic() - self._birth.get(driver, time.monotonic())
+                worn_out = (
+                    self._uses[driver] >= self.max_uses
+                    or age >= self.max_age_seconds
+                )
+            if worn_out:
+                self._discard(driver)
+                return
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except WebDriverException:
+                self._discard(driver)
+            else:
+                # Park the driver before releasing the permit so a woken
+                # waiter finds it instead of creating an extra one.
+                self._idle.put(driver)
+                self._slots.release()
+
+    def close_all(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver, release_slot=False)
+        if self._service is not None:
+            self._service.stop()
+            self._service = None
+
+
+class WebDriverBase:
+    driver = None
+
+    def __init__(self, app_config: AppConfig):
+        self.app_config = app_config
+        self._pool = DriverPool.shared(app_config)
+
+    @contextmanager
+    def borrowed_driver(self):
+        """Borrow a pooled driver, exposing it as self.driver for the scrape."""
+        with self._pool.acquire() as driver:
+            self.driver = driver
+            try:
+                yield driver
+            finally:
+                self.driver = None
+
+    def _drain_browser_console(self):
+        """
+        Log the browser console for postmortem context. webdriver.Remote has
+        no get_log convenience method (it lives on ChromiumDriver), but the
+        chromium remote connection still registers the vendor command, so
+        fall back to issuing it directly. Best-effort: a failure to fetch
+        logs must never mask the error being diagnosed.
+        """
+        try:
+            if hasattr(self.driver, "get_log"):
+                entries = self.driver.get_log("browser")
+            else:
+                entries = self.driver.execute("getLog", {"type": "browser"})["value"]
+            for entry in entries:
+                logger.info(entry)
+        except (WebDriverException, KeyError) as e:
+            logger.debug(f"Could not drain browser console: {e}")
 
 
 class AbstractHunter(ABC):
@@ -99,6 +430,16 @@ class AbstractHunter(ABC):
     Defines the template methods and properties each hunter must implement.
     """
 
+    # The invariant parts of every Discord embed, built once instead of
+    # re-allocated per listing.
+    _EMBED_SKELETON = {
+        "color": 4937567,
+        "author": {
+            "name": "SUUMO",
+            "icon_url": "https://cdn3.emoji.gg/emojis/9666-link.png",
+        },
+    }
+
     def __init__(
         self, config: Union[SectionProxy, Dict[str, Union[str, bool, int]]]
     ) -> None:
@@ -106,17 +447,28 @@ class AbstractHunter(ABC):
         Initialize the hunter with a configuration section from configparser or a dictionary.
         """
         self.config = config
+        # Diagnostics (screenshots, HTML dumps) are opt-in; they cost a
+        # Chrome paint + PNG encode and multi-MB disk writes per cycle.
+        self.debug = os.getenv("HUNTER_DEBUG", "0") == "1"
+        # Keep only the newest K URLs on disk; delisted properties never
+        # reappear, so older history is dead weight. 0 disables pruning.
+        self.seen_cache_size = int(self.config.get("seen_cache_size", 5000))
         self.listings = {
-            "seen_listings": {},
-            "new_listings": [],
+            # Embeds for newly found listings, formatted once at discovery
+            # and flushed by announce_new_listings.
+            "pending_embeds": [],
         }
+        # Paths are computed (and the directory created) once; the hot
+        # paths below only ever read these cached attributes.
+        self._storage_directory = os.path.join(
+            "results", self.__class__.__name__.lower()
+        )
+        self.ensure_storage_directory_exists()
+        self._seen_listings_file = os.path.join(
+            self._storage_directory, "seen_listings.db"
+        )
         self.load_seen_listings()
 
-    def restart_driver(self):
-        """Close and restart the WebDriver."""
-        self.close_driver()
-        self.driver = self._init_driver()
-
     @abstractmethod
     def check_for_new_listings(self):
         """
@@ -125,164 +477,240 @@ class AbstractHunter(ABC):
         """
         pass
 
+    async def run_forever(self):
+        """
+        Poll the site indefinitely. The blocking scrape runs in a worker
+        thread so hunters for other sites can run concurrently; only the
+        wait between checks is spent in the event loop.
+        """
+        interval = int(os.getenv("WAIT_SECONDS_BETWEEN_CHECKS", "60"))
+        next_check = time.monotonic()
+        failures = 0
+        while True:
+            try:
+                await asyncio.to_thread(self.check_for_new_listings)
+                failures = 0
+            except WebDriverException as e:
+                # The pool has already discarded the broken browser.
+                failures += 1
+                logger.error(f"❗ WebDriver error: {e}", exc_info=True)
+            except Exception as e:
+                failures += 1
+                logger.error(
+                    f"❗ Error processing {type(self).__name__}: {e}", exc_info=True
+                )
+            # Anchor the cadence to the wall clock so checks fire every
+            # `interval` seconds regardless of how long the scrape took,
+            # skipping ahead (not bursting) if a scrape overran.
+            next_check += interval
+            delay = next_check - time.monotonic()
+            if delay <= 0:
+                next_check = time.monotonic()
+                delay = 0
+            if failures:
+                # Consecutive failures usually mean the site or network is
+                # unhappy; back off exponentially (capped at 10x cadence)
+                # instead of hammering it every cycle.
+                backoff = min(interval * 2 ** (failures - 1), interval * 10)
+                if backoff > delay:
+                    delay = backoff
+                    next_check = time.monotonic() + delay
+                logger.warning(
+                    "Backing off %.0fs after %d consecutive failures.",
+                    delay,
+                    failures,
+                )
+            logger.info(f"Waiting for {delay:.0f} seconds before the next check...")
+            await asyncio.sleep(delay)
+
     @property
     def storage_directory(self):
         """
-        Returns a directory name derived from the class name for saving files.
-        This eliminates the need for subclasses to override this unless a custom name is desired.
+        Directory derived from the class name for saving files, computed
+        once at init. Subclasses only override this for a custom name.
         """
-        class_name = self.__class__.__name__.lower()
-        directory_name = f"{class_name}"
-        parent_directory = "results"
-        full_directory_path = os.path.join(parent_directory, directory_name)
-        return full_directory_path
+        return self._storage_directory
 
     def ensure_storage_directory_exists(self):
-        """Ensure the storage directory exists."""
-        os.makedirs(self.storage_directory, exist_ok=True)
-        if not os.access(self.storage_directory, os.W_OK):
+        """Create the storage directory; called once from __init__."""
+        os.makedirs(self._storage_directory, exist_ok=True)
+        if not os.access(self._storage_directory, os.W_OK):
             raise PermissionError(
-                f"Directory {self.storage_directory} is not writable."
+                f"Directory {self._storage_directory} is not writable."
             )
 
     def save_screenshot(self, filename):
         """
-        Saves a screenshot with the given filename into the hunter's specific storage directory.
+        Saves a screenshot into the hunter's storage directory.
+        No-op unless HUNTER_DEBUG=1.
         """
-        self.ensure_storage_directory_exists()
+        if not self.debug:
+            return
         filepath = os.path.join(self.storage_directory, filename)
         self.driver.save_screenshot(filepath)
         logger.info(f"Screenshot saved to {filepath}")
 
     def save_html_content(self, html_content, filename):
         """
-        Saves HTML content to a file within the hunter's specific storage directory.
+        Saves HTML content to a file within the hunter's storage directory.
+        No-op unless HUNTER_DEBUG=1; the write happens on a background
+        thread so the scrape never waits on disk.
         """
-        self.ensure_storage_directory_exists()
+        if not self.debug:
+            return
         filepath = os.path.join(self.storage_directory, filename)
-        with open(filepath, "w", encoding="utf-8") as file:
-            file.write(html_content)
-        logger.info(f"HTML content saved to {filepath}")
+
+        def _write():
+            with open(filepath, "w", encoding="utf-8") as file:
+                file.write(html_content)
+            logger.info(f"HTML content saved to {filepath}")
+
+        threading.Thread(target=_write, daemon=True).start()
 
     @property
     def seen_listings_file(self):
+        """File path for the seen-listings database, computed once at init."""
+        return self._seen_listings_file
+
+    def load_seen_listings(self):
         """
-        Returns the file path for saving seen listings, incorporating the storage directory.
+        Open the on-disk seen-listings store. Membership lives in an indexed
+        sqlite table rather than an in-memory set, so RAM stays bounded no
+        matter how many months of history accumulate.
         """
-        self.ensure_storage_directory_exists()
-        return os.path.join(self.storage_directory, "seen_listings.json")
+        is_new_store = not os.path.exists(self.seen_listings_file)
+        self._seen_db = sqlite3.connect(
+            self.seen_listings_file, check_same_thread=False
+        )
+        self._seen_db.execute("PRAGMA journal_mode=WAL")
+        self._seen_db.execute("CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY)")
+        self._seen_db.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache "
+            "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT)"
+        )
+        self._seen_db.commit()
 
-    def load_seen_listings(self):
-        self.ensure_storage_directory_exists()
+        if is_new_store:
+            self._migrate_legacy_seen_listings()
+
+        count = self._seen_db.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        logger.info("Seen-listings store holds %d listings.", count)
 
+    def _migrate_legacy_seen_listings(self):
+        """
+        Import URLs from the old seen_listings.txt / seen_listings.json
+        formats so an upgrade doesn't re-announce every listing.
+        """
+        urls = set()
+        txt_file = os.path.join(self.storage_directory, "seen_listings.txt")
         try:
-            with open(self.seen_listings_file, "r") as file:
-                self.seen_listings = json.load(file)
-            logger.info("Loaded seen listings from file.")
+            with open(txt_file, "r", encoding="utf-8") as file:
+                urls.update(line.rstrip("\n") for line in file if line.strip())
         except FileNotFoundError:
-            self.seen_listings = {}
-            logger.info("Seen listings file not found. Starting with an empty set.")
-        except json.JSONDecodeError:
-            self.seen_listings = {}
-            logger.error(
-                "Error decoding the seen listings file. Starting with an empty set."
-            )
+            pass
 
-    def save_seen_listings(self):
+        json_file = os.path.join(self.storage_directory, "seen_listings.json")
         try:
-            # Load existing seen listings from file
-            existing_seen_listings = {}
-            try:
-                with open(self.seen_listings_file, "r", encoding="utf-8") as file:
-                    existing_seen_listings = json.load(file)
-            except FileNotFoundError:
-                logger.info("Seen listings file not found. Creating a new one.")
-            except json.JSONDecodeError:
-                logger.error(
-                    "Error decoding the seen listings file. Starting with an empty set."
-                )
+            with open(json_file, "rb") as file:
+                urls.update(orjson.loads(file.read()))
+        except FileNotFoundError:
+            pass
+        except orjson.JSONDecodeError:
+            logger.error("Error decoding the legacy seen listings file, skipping it.")
 
-            # Update existing seen listings with new ones
-            updated_seen_listings = {
-                **existing_seen_listings,
-                **self.listings["seen_listings"],
-            }
+        if not urls:
+            logger.info("No previous seen listings found. Starting fresh.")
+            return
 
-            if updated_seen_listings:
-                first_url, first_listing_details = next(
-                    iter(updated_seen_listings.items())
-                )
-                pretty_first_listing = json.dumps(
-                    {first_url: first_listing_details}, indent=4, ensure_ascii=False
-                )
-                logger.debug(f"First seen listing to be saved: {pretty_first_listing}")
-            else:
-                logger.debug("No listings to save.")
+        self._seen_db.executemany(
+            "INSERT OR IGNORE INTO seen (url) VALUES (?)", ((url,) for url in urls)
+        )
+        self._seen_db.commit()
+        logger.info("Migrated %d seen listings from legacy files.", len(urls))
+
+    def has_listing_been_seen(self, url):
+        """Exact membership check against the indexed sqlite store."""
+        cursor = self._seen_db.execute(
+            "SELECT 1 FROM seen WHERE url = ? LIMIT 1", (url,)
+        )
+        return cursor.fetchone() is not None
+
+    def get_http_validators(self, url):
+        """Return the stored (etag, last_modified) pair for a URL, if any."""
+        row = self._seen_db.execute(
+            "SELECT etag, last_modified FROM http_cache WHERE url = ?", (url,)
+        ).fetchone()
+        return row if row else (None, None)
 
-            # Save updated seen listings back to file
-            pretty_listings = json.dumps(
-                updated_seen_listings, indent=4, ensure_ascii=False
+    def store_http_validators(self, url, etag, last_modified):
+        if not etag and not last_modified:
+            return
+        with self._seen_db:
+            self._seen_db.execute(
+                "INSERT OR REPLACE INTO http_cache (url, etag, last_modified) "
+                "VALUES (?, ?, ?)",
+                (url, etag, last_modified),
             )
-            with open(self.seen_listings_file, "w") as file:
-                file.write(pretty_listings)
 
-            logger.info("Saved seen listings to file: %s", self.seen_listings_file)
-        except IOError as e:
-            logger.error(f"IOError when trying to save seen listings: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error when saving seen listings: {e}")
+    def mark_listings_seen(self, urls):
+        """Record a batch of URLs as seen in one transaction (one fsync)."""
+        with self._seen_db:
+            self._seen_db.executemany(
+                "INSERT OR IGNORE INTO seen (url) VALUES (?)", ((url,) for url in urls)
+            )
+            if self.seen_cache_size > 0:
+                # Evict everything older than the newest K rows; the
+                # subquery is NULL (so nothing matches) while under the cap.
+                self._seen_db.execute(
+                    "DELETE FROM seen WHERE rowid <= ("
+                    "SELECT rowid FROM seen ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                    (self.seen_cache_size,),
+                )
 
     def process_listings(self, scraped_listings):
-        """Process a batch of scraped listings."""
+        """Process a batch of scraped listings with one dedupe pass."""
         if not scraped_listings:
-            print("No listings to process.", flush=True)
             logger.info("No listings to process.")
             return
 
-        logger.info("\n===== Processing Scraped Listings =====\n")
-
-        new_listings_count = 0
-        seen_listings_count = 0
-
+        new_urls = set()
+        new_listings = []
         for listing in scraped_listings:
-            logger.info(f"Evaluating listing: {listing['url']}")
-            if listing["url"] not in self.seen_listings:
-                new_listings_count += 1
-                self.listings["new_listings"].append(listing)
-                self.listings["seen_listings"][listing["url"]] = listing
-                logger.info(
-                    json.dumps(
-                        {
-                            "action": "New listing found",
-                            "url": listing["url"],
-                            "details": listing,
-                        },
-                        indent=4,
-                    )
-                )
-            else:
-                seen_listings_count += 1
-                logger.info(
-                    json.dumps(
-                        {"action": "Already seen, skipping", "url": listing["url"]},
-                        indent=4,
-                    )
-                )
-
-        logger.info("\n===== Summary =====")
-        logger.info(f"New listings found: {new_listings_count}")
-        logger.info(f"Listings already seen: {seen_listings_count}")
-        if new_listings_count == 0:
-            logger.info("No new listings found, skipping notification.")
+            url = listing["url"]
+            if url not in new_urls and not self.has_listing_been_seen(url):
+                new_urls.add(url)
+                new_listings.append(listing)
+
+        # format_listing_message returns None on malformed details; never
+        # let a None embed reach the webhook payload.
+        self.listings["pending_embeds"].extend(
+            embed
+            for embed in map(self.format_listing_message, new_listings)
+            if embed is not None
+        )
+        # One transaction for the whole batch instead of a commit per URL.
+        if new_urls:
+            self.mark_listings_seen(new_urls)
+
+        # A single summary line instead of one log call per listing.
+        logger.info(
+            "Scraped %d listings: %d new, %d already seen.",
+            len(scraped_listings),
+            len(new_listings),
+            len(scraped_listings) - len(new_listings),
+        )
+        if new_listings:
+            logger.info(
+                "New listings: %s",
+                ", ".join(listing["url"] for listing in new_listings),
+            )
+        if logger.isEnabledFor(logging.DEBUG):
+            for listing in new_listings:
+                logger.debug(json.dumps(listing, indent=4, ensure_ascii=False))
 
-        if self.listings["new_listings"]:
+        if self.listings["pending_embeds"]:
             self.announce_new_listings()
 
-        self.save_seen_listings()
-        self.load_seen_listings()
-
-        self.listings["new_listings"] = []
-
     def format_listing_message(self, listing_details):
         try:
             description = f"""
@@ -290,10 +718,10 @@ class AbstractHunter(ABC):
             """
 
             embed_payload = {
+                **self._EMBED_SKELETON,
                 "title": listing_details.get("price"),
                 "description": description,
                 "url": listing_details.get("url"),
-                "color": 4937567,
                 "fields": [
                     {
                         "name": "Access",
@@ -302,9 +730,8 @@ class AbstractHunter(ABC):
                     },
                 ],
                 "author": {
-                    "name": "SUUMO",
+                    **self._EMBED_SKELETON["author"],
                     "url": listing_details.get("url"),
-                    "icon_url": "https://cdn3.emoji.gg/emojis/9666-link.png",
                 },
                 "image": {"url": listing_details.get("image_url")},
             }
@@ -315,46 +742,44 @@ class AbstractHunter(ABC):
             return None
 
     def announce_new_listings(self):
-        """Announce new listings based on their count."""
-        new_listings_count = len(self.listings["new_listings"])
+        """Flush buffered embeds, batching them into as few POSTs as possible."""
+        embeds = self.listings["pending_embeds"]
 
-        if new_listings_count == 0:
+        if not embeds:
             return
 
-        if new_listings_count < 3:
-            for listing in self.listings["new_listings"]:
-                logger.info("Preparing message for %s", listing["url"])
-                embed_payload = self.format_listing_message(listing)
-                self.send_notification({"content": "", "embeds": [embed_payload]})
-        else:
-            logger.info(
-                "Preparing summary for %d listings", len(self.listings["new_listings"])
+        logger.info("Preparing notification for %d listings", len(embeds))
+        content = ""
+        if len(embeds) >= 3:
+            target_url = self.config["target_url"]
+            content = (
+                f"Found {len(embeds)} new listings. View on [SUUMO]({target_url})"
+            )
+            if self.app_config.role_id:
+                content = f"<@&{self.app_config.role_id}> " + content
+
+        # Discord webhooks accept at most 10 embeds per message, so one POST
+        # covers the common case and large batches chunk instead of sending
+        # one request per listing.
+        for start in range(0, len(embeds), 10):
+            self.send_notification(
+                {
+                    "content": content if start == 0 else "",
+                    "embeds": embeds[start : start + 10],
+                }
             )
-            self.send_summary_notification(self.listings["new_listings"])
 
-        self.listings["new_listings"] = []
+        self.listings["pending_embeds"] = []
 
     def send_notification(self, embed_payload):
-        """Send a notification with the given payload."""
+        """Queue a notification with the given payload for async delivery."""
         if self.app_config.enable_notifications and self.app_config.notification_url:
-            try:
-                logger.info(
-                    f"Payload to send notification:\n{json.dumps(embed_payload, indent=4)}"
-                )
-                response = requests.post(
-                    self.app_config.notification_url, json=embed_payload
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Payload to send notification:\n%s",
+                    json.dumps(embed_payload, indent=4),
                 )
-                response.raise_for_status()  # Raise an exception if a non-200 status code is returned
-                logger.info("Notification sent successfully.")
-            except requests.exceptions.HTTPError as e:
-                logger.error("Failed to send notification: %s", e)
-            except requests.exceptions.ConnectionError as e:
-                logger.error("Failed to send notification: %s", e)
-            except requests.exceptions.Timeout as e:
-                logger.error("Failed to send notification: %s", e)
-            except requests.exceptions.RequestException as e:
-                logger.error("Failed to send notification: %s", e)
-
+            enqueue_notification(self.app_config.notification_url, embed_payload)
         else:
             logger.info(
                 "Notifications are disabled, or notification URL is not provided, skipping notification."
@@ -364,183 +789,267 @@ class AbstractHunter(ABC):
                 "⚠️  Edit the environment variables to enable notifications.  ⚠️ "
             )
 
-    def send_summary_notification(self, listings):
-        """Send a summary notification for multiple listings."""
-
-        target_url = self.config["target_url"]
-        content = f"Found {len(listings)} new listings. View on [SUUMO]({target_url})"
-        if self.app_config.role_id:
-            content = f"<@&{self.app_config.role_id}> " + content
-        embeds = [self.format_listing_message(listing) for listing in listings[:3]]
-        self.send_notification({"content": content, "embeds": embeds})
-
 
 class SUUMOHunter(AbstractHunter, WebDriverBase):
+    # Selectors are compiled once at class-definition time instead of being
+    # re-parsed for every listing in the hot loop.
+    _JS_LISTINGS_READY = (
+        "return document.querySelectorAll("
+        "\"#right_sliderList2 li[id^='jsiRightSliderListChild_']\""
+        ").length > 0"
+    )
+    _XP_LISTINGS = etree.XPath(
+        "//*[@id='right_sliderList2']"
+        "//li[starts-with(@id, 'jsiRightSliderListChild_')]"
+    )
+    _XP_LINK = etree.XPath(".//p/a")
+    _XP_FEATURES = etree.XPath(".//ul[contains(@class, 'cf')]/li")
+    _XP_PRICES = etree.XPath(".//div[@class='fr w105 bw']/p[contains(text(), '円')]")
+    _XP_SIZE = etree.XPath(".//div[contains(@class, 'fr')]/p[2]")
+    _XP_RATIOS = etree.XPath(
+        ".//div[@class='fr w105 bw']/p[contains(text(), '建ぺい率・容積率')]"
+    )
+    _XP_TRANSPORT = etree.XPath(".//p[contains(@class, 'mt5')][2]")
+    _XP_IMAGE = etree.XPath(
+        ".//*[contains(@class, 'fl') and contains(@class, 'w90')]//img"
+    )
+    _RE_TSUBO_PRICE = re.compile(r"\d+(\.\d+)?万円")
+    _RE_IMG_DIMENSIONS = re.compile(r"&w=\d+&h=\d+")
+
     def __init__(self, app_config: AppConfig):
         suumo_config = app_config.config["SUUMO"]
-        AbstractHunter.__init__(self, config=suumo_config)
+        # Hand the hunter a plain-dict snapshot; hot-path lookups then skip
+        # configparser's section/default-chain indirection.
+        AbstractHunter.__init__(self, config=dict(suumo_config))
         WebDriverBase.__init__(self, app_config=app_config)
+        # With needs_js = false no driver is ever borrowed from the pool;
+        # the page is fetched over plain HTTP instead.
+        self.needs_js = suumo_config.getboolean("needs_js", fallback=True)
+        # Parsed once here rather than re-read and re-cast every cycle.
+        self.target_url = suumo_config["target_url"]
+        self.dynamic_content_timeout = suumo_config.getfloat(
+            "dynamic_content_timeout", fallback=20.0
+        )
+        self.session = requests.Session()
 
-    def check_for_new_listings(self):
-        logger.debug(f"Accessing URL: {self.config['target_url']}")
-        self.driver.get(self.config["target_url"])
+    def _fetch_static(self, url: str) -> Union[str, None]:
+        """
+        Fetch the target page over plain HTTP with a keep-alive session,
+        using a conditional GET so an unchanged page costs one 304 response
+        instead of a download and parse. Returns None when unchanged.
+        """
+        logger.debug(f"Fetching URL over HTTP: {url}")
+        headers = {}
+        etag, last_modified = self.get_http_validators(url)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = self.session.get(url, headers=headers, timeout=30)
+        if response.status_code == 304:
+            logger.info("Listing page unchanged (HTTP 304), skipping scrape.")
+            return None
+        response.raise_for_status()
+        self.store_http_validators(
+            url, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
+        return response.text
+
+    def _fetch_rendered(self, url: str) -> str:
+        """
+        Load the target page in headless Chrome and return its HTML once the
+        dynamic listing container has rendered.
+        """
+        logger.debug(f"Accessing URL: {url}")
+        self.driver.get(url)
         self.save_screenshot("screenshot_initial_load.png")
-        page_source = self.driver.page_source
-        self.save_html_content(page_source, "page_source_initial_load.html")
+        if self.debug:
+            # CDP hands back the rendered page as one MHTML blob, without
+            # the DOM-serializing page_source round-trip.
+            snapshot = self.driver.execute_cdp_cmd(
+                "Page.captureSnapshot", {"format": "mhtml"}
+            )["data"]
+            self.save_html_content(snapshot, "page_initial_load.mhtml")
 
         logger.info("Waiting for listings to load...")
-        element_present = EC.presence_of_element_located(
-            (By.CSS_SELECTOR, "#right_sliderList2")
+        # Each poll is a single execute_script round-trip returning a bool,
+        # rather than marshalling matched WebElements back to Python; the
+        # tighter poll interval shaves latency once the slider renders.
+        WebDriverWait(
+            self.driver,
+            self.dynamic_content_timeout,
+            poll_frequency=0.1,
+        ).until(lambda driver: driver.execute_script(self._JS_LISTINGS_READY))
+        # The listings are in the DOM; anything still in flight (map tiles,
+        # trackers, late scripts) is weight we never read. Cut it loose
+        # before serializing the page.
+        self.driver.execute_script("window.stop();")
+        return self.driver.page_source
+
+    def extract_listings(self, page_source: str) -> List[Dict]:
+        """
+        Parse every listing out of a single HTML snapshot with lxml.
+        This replaces per-field WebDriver lookups, each of which was a
+        JSON-over-HTTP round-trip to chromedriver.
+        """
+        tree = lxml_html.fromstring(page_source)
+        # Selenium's get_attribute("href"/"src") returned resolved absolute
+        # URLs; raw lxml attributes keep whatever the markup says. Resolve
+        # everything against the page URL so seen-store keys stay comparable
+        # with history and Discord embed URLs are always absolute.
+        tree.make_links_absolute(self.target_url)
+        all_listings = []
+        already_seen = 0
+        listings = self._XP_LISTINGS(tree)
+        for listing in listings:
+            # Cheap URL-only probe first: in steady state most listings are
+            # already seen, so their full field extraction is skipped.
+            links = self._XP_LINK(listing)
+            link = links[0] if links else None
+            url = link.get("href") if link is not None else None
+            if url and self.has_listing_been_seen(url):
+                already_seen += 1
+                continue
+            try:
+                all_listings.append(self._extract_listing_details(listing, link))
+            except (IndexError, ValueError) as e:
+                logger.error(f"Error extracting details for listing: {e}")
+        logger.info(
+            "Found %d listings (%d already seen, extraction skipped)",
+            len(listings),
+            already_seen,
         )
-        WebDriverWait(self.driver, self.config["dynamic_content_timeout"]).until(
-            element_present
+        return all_listings
+
+    def _extract_listing_details(self, listing, link=None) -> Dict:
+        """
+        Extract the fields of interest from one parsed <li> element.
+        The caller passes the anchor it already located during the
+        seen-URL probe so it isn't queried twice.
+        """
+        if link is None:
+            link = self._XP_LINK(listing)[0]
+        property_name = link.text_content().strip()
+        property_url = link.get("href")
+
+        property_features = "\n".join(
+            element.text_content().strip() for element in self._XP_FEATURES(listing)
         )
 
-        try:
-            all_listings = []
-            listings = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "#right_sliderList2  li[id^='jsiRightSliderListChild_']",
-            )
-            logger.info(f"Found {len(listings)} listings", extra={"listings": listings})
-            for listing in listings:
-                try:
-                    property_name = listing.find_element(By.CSS_SELECTOR, "p a").text
-                    property_features_elements = listing.find_elements(
-                        By.CSS_SELECTOR, "ul.cf li"
-                    )
-                    property_features = "\n".join(
-                        element.text for element in property_features_elements
-                    )
-
-                    # Price and per_tsubo price
-                    price_elements = listing.find_elements(
-                        By.XPATH,
-                        ".//div[@class='fr w105 bw']/p[contains(text(), '円')]",
-                    )
-
-                    price = "Not found"
-                    price_per_tsubo = "Not found"
-
-                    for elem in price_elements:
-                        text = elem.text
-                        # Check for total price
-                        if "万円" in text and price == "Not found":
-                            price = text
-                        # Check for price per tsubo
-                        elif "坪単価" in text:
-                            match = re.search(r"\d+(\.\d+)?万円", text)
-                            if match:
-                                price_per_tsubo = match.group()
-
-                    # Get the size of the property
-                    try:
-                        size_element = listing.find_element(
-                            By.CSS_SELECTOR, "div.fr p:nth-of-type(2)"
-                        ).text
-                        # Remove the prefix and replace m² or ㎡ with sqm
-                        size = (
-                            size_element.replace("土地／", "")
-                            .replace("m<sup>2</sup>", "sqm")
-                            .replace("㎡", "sqm")
-                        )
-
-                        size = re.sub(r"<[^>]+>", "", size)
-
-                    except NoSuchElementException:
-                        size = "Not Available"
-
-                    # Building and floor coverage ratios
-                    try:
-                        # Find the element containing both ratios
-                        ratios_element = listing.find_element(
-                            By.XPATH,
-                            ".//div[@class='fr w105 bw']/p[contains(text(), '建ぺい率・容積率')]",
-                        )
-                        ratios_text = ratios_element.text
-
-                        # Extracting the ratios using split
-                        _, ratios_combined = ratios_text.split("／")
-                        (
-                            building_coverage_ratio_value,
-                            floor_area_ratio_value,
-                        ) = ratios_combined.split("　")
-
-                        # Formatting the ratios
-                        building_coverage_ratio = f"{building_coverage_ratio_value}"
-                        floor_area_ratio = f"{floor_area_ratio_value}"
-
-                    except NoSuchElementException:
-                        building_coverage_ratio = "Not Available"
-                        floor_area_ratio = "Not Available"
-                    except (
-                        ValueError
-                    ):  # In case the text format is unexpected and split fails
-                        building_coverage_ratio = "Not Available"
-                        floor_area_ratio = "Not Available"
-
-                    transportation = listing.find_element(
-                        By.CSS_SELECTOR, "p.mt5:nth-of-type(2)"
-                    ).text
-
-                    # Get high res image
-                    try:
-                        image_url = listing.find_element(
-                            By.CSS_SELECTOR, ".fl.w90 img"
-                        ).get_attribute("src")
-
-                        # Use regex to replace &w=NNN&h=NNN with &w=1000&h=1000
-                        modified_image_url = re.sub(
-                            r"&w=\d+&h=\d+", "&w=500&h=500", image_url
-                        )
-
-                        # Use the modified_image_url as needed
-                        image_url = modified_image_url
-
-                    except NoSuchElementException:
-                        logger.error("Image element not found.")
-                        image_url = None
-                    except Exception as e:
-                        logger.error(f"Unexpected error when processing image URL: {e}")
-                        image_url = None
-
-                    property_url = listing.find_element(
-                        By.CSS_SELECTOR, "p a"
-                    ).get_attribute("href")
-
-                    listing_details = {
-                        "price": price,
-                        "name": property_name,
-                        "size": size,
-                        "price_per_tsubo": price_per_tsubo,
-                        "building_coverage_ratio": building_coverage_ratio,
-                        "floor_area_ratio": floor_area_ratio,
-                        "features": property_features,
-                        "transportation": transportation,
-                        "url": property_url,
-                        "image_url": image_url,
-                        "html_list_item": listing.get_attribute("outerHTML"),
-                    }
-
-                    all_listings.append(listing_details)
-
-                except NoSuchElementException as e:
-                    logger.error(f"Error extracting details for listing: {e}")
-
-            self.process_listings(all_listings)
+        # Price and per_tsubo price
+        price_elements = self._XP_PRICES(listing)
+
+        price = "Not found"
+        price_per_tsubo = "Not found"
+
+        for elem in price_elements:
+            text = elem.text_content()
+            # Check for total price
+            if "万円" in text and price == "Not found":
+                price = text.strip()
+            # Check for price per tsubo
+            elif "坪単価" in text:
+                match = self._RE_TSUBO_PRICE.search(text)
+                if match:
+                    price_per_tsubo = match.group()
+
+        # Get the size of the property
+        size_elements = self._XP_SIZE(listing)
+        if size_elements:
+            size_element = size_elements[0].text_content()
+            # text_content() already yields plain text, so only the prefix
+            # and the ㎡ glyph need normalising.
+            size = size_element.replace("土地／", "").replace("㎡", "sqm").strip()
+        else:
+            size = "Not Available"
+
+        # Building and floor coverage ratios. partition() splits at most
+        # once and never raises, so an unexpected format just falls back
+        # without exception handling or throwaway lists.
+        building_coverage_ratio = floor_area_ratio = "Not Available"
+        ratios_elements = self._XP_RATIOS(listing)
+        if ratios_elements:
+            ratios_text = ratios_elements[0].text_content()
+            _, label_sep, ratios_combined = ratios_text.partition("／")
+            bcr, ratio_sep, far = ratios_combined.partition("　")
+            if label_sep and ratio_sep:
+                building_coverage_ratio = bcr
+                floor_area_ratio = far
+
+        transportation_elements = self._XP_TRANSPORT(listing)
+        transportation = (
+            transportation_elements[0].text_content().strip()
+            if transportation_elements
+            else "Not Available"
+        )
 
-            self.announce_new_listings()
+        # Get high res image
+        image_elements = self._XP_IMAGE(listing)
+        if image_elements:
+            image_url = image_elements[0].get("src")
+            # Use regex to replace &w=NNN&h=NNN with &w=500&h=500
+            image_url = self._RE_IMG_DIMENSIONS.sub("&w=500&h=500", image_url)
+        else:
+            logger.error("Image element not found.")
+            image_url = None
+
+        return {
+            "price": price,
+            "name": property_name,
+            "size": size,
+            "price_per_tsubo": price_per_tsubo,
+            "building_coverage_ratio": building_coverage_ratio,
+            "floor_area_ratio": floor_area_ratio,
+            "features": property_features,
+            "transportation": transportation,
+            "url": property_url,
+            "image_url": image_url,
+        }
 
-        except StaleElementReferenceException as e:
-            logger.error(f"StaleElementReferenceException: {e}")
-            self.restart_driver()
-            self.check_for_new_listings()
+    def check_for_new_listings(self):
+        target_url = self.target_url
 
-        finally:
-            for entry in self.driver.get_log("browser"):
-                logger.info(entry)
-            self.close_driver()
-            logger.info("Driver closed")
+        if not self.needs_js:
+            page_source = self._fetch_static(target_url)
+            if page_source is None:
+                return
+            self.process_listings(self.extract_listings(page_source))
+            return
+
+        # Bounded retry rather than recursion: a persistently broken page
+        # gives up after a few attempts instead of growing the stack.
+        max_attempts = 3
+        for attempt in range(1, max_attempts + 1):
+            try:
+                with self.borrowed_driver():
+                    try:
+                        page_source = self._fetch_rendered(target_url)
+                    except TimeoutException:
+                        # Only a failed wait is worth the chromedriver
+                        # round-trip of draining the browser console;
+                        # success paths skip it.
+                        self._drain_browser_console()
+                        raise
+
+                    self.process_listings(self.extract_listings(page_source))
+                return
+
+            except StaleElementReferenceException as e:
+                # The pool discarded the stale browser; retry with a
+                # fresh one after a short, growing pause.
+                logger.error(
+                    "StaleElementReferenceException (attempt %d/%d): %s",
+                    attempt,
+                    max_attempts,
+                    e,
+                )
+                if attempt < max_attempts:
+                    time.sleep(0.5 * attempt)
+        logger.error(
+            "Giving up after %d stale-element attempts; will retry next cycle.",
+            max_attempts,
+        )
 
 
 def signal_handler(sig, frame):
@@ -582,6 +1091,24 @@ def check_notification_settings(app_config: AppConfig):
         print(alert_message, flush=True)
 
 
+def build_hunters(app_config: AppConfig) -> list:
+    """Construct one hunter per configured site section."""
+    hunters = []
+    for section in app_config.config.sections():
+        if section == "Common":
+            continue
+        if section == "SUUMO":
+            hunters.append(SUUMOHunter(app_config=app_config))
+        else:
+            logger.warning(f"No hunter implemented for [{section}], skipping.")
+    return hunters
+
+
+async def run_hunters(hunters):
+    """Run every hunter's poll loop concurrently."""
+    await asyncio.gather(*(hunter.run_forever() for hunter in hunters))
+
+
 def main():
     logger = setup_logging()
     app_config = AppConfig()
@@ -589,28 +1116,18 @@ def main():
     logger.info("Starting home-hunter")
     check_notification_settings(app_config)
 
-    hunter = SUUMOHunter(app_config=app_config)
-
-    while True:
-        try:
-            hunter.restart_driver()
-            hunter.check_for_new_listings()
-            hunter.close_driver()
-            sleep_time = int(os.getenv("WAIT_SECONDS_BETWEEN_CHECKS", "60"))
-            logger.info(f"Waiting for {sleep_time} seconds before the next check...")
-            time.sleep(sleep_time)
-        except Exception as e:
-            logger.error(f"❗ Error processing SUUMOHunter: {e}", exc_info=True)
-            hunter.close_driver()
-            sleep_time = int(os.getenv("WAIT_SECONDS_BETWEEN_CHECKS", "60"))
-            logger.info(
-                f"Restarting after error. Waiting for {sleep_time} seconds before the next check..."
-            )
-            time.sleep(sleep_time)
-        except KeyboardInterrupt:
-            logger.warning("🛑 Home-hunter terminated by user.")
-            hunter.close_driver()
-            break
+    hunters = build_hunters(app_config)
+    if not hunters:
+        logger.error("No hunters configured in websites.ini, exiting.")
+        return
+
+    try:
+        asyncio.run(run_hunters(hunters))
+    except KeyboardInterrupt:
+        logger.warning("🛑 Home-hunter terminated by user.")
+    finally:
+        wait_for_pending_notifications()
+        DriverPool.close_shared()
 
 
 if __name__ == "__main__":